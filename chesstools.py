@@ -2,7 +2,7 @@ import os
 import sys
 from themes.theme import Theme
 from image_processing.fen_to_image import render_from_fen, render_from_fen_file
-from image_processing.pgn_to_image import render_from_pgn_string, render_from_pgn_file, render_from_pgn_folder
+from image_processing.pgn_to_image import render_from_pgn_string, render_from_pgn_file, render_from_pgn_folder, render_unique_from_pgn_folder
 
 def main_menu():
     theme = load_default_theme()
@@ -64,9 +64,11 @@ def generate_from_pgn_string(theme):
     output_dir = input("Enter the output directory: ").strip()
     output_file = input("Enter the output filename: ").strip()
     final_position_only = input("Generate only the final position? (yes/no): ").strip().lower() == "yes"
+    overlay = input("Highlight the last move and checks? (yes/no): ").strip().lower() == "yes"
+    coordinates = input("Draw board coordinates? (yes/no): ").strip().lower() == "yes"
 
     try:
-        render_from_pgn_string(pgn_string, theme, output_dir, output_file, final_position_only)
+        render_from_pgn_string(pgn_string, theme, output_dir, output_file, final_position_only, overlay, coordinates)
         print(f"Images successfully generated and saved to {output_dir}")
     except Exception as e:
         print(f"Error generating images: {e}")
@@ -76,13 +78,15 @@ def generate_from_pgn_file(theme):
     output_dir = input("Enter the output directory: ").strip()
     output_file = input("Enter the output filename: ").strip()
     final_position_only = input("Generate only the final position? (yes/no): ").strip().lower() == "yes"
+    overlay = input("Highlight the last move and checks? (yes/no): ").strip().lower() == "yes"
+    coordinates = input("Draw board coordinates? (yes/no): ").strip().lower() == "yes"
 
     if not os.path.isfile(pgn_file):
         print(f"File not found: {pgn_file}")
         return
 
     try:
-        render_from_pgn_file(pgn_file, theme, output_dir, output_file, final_position_only)
+        render_from_pgn_file(pgn_file, theme, output_dir, output_file, final_position_only, overlay, coordinates)
         print(f"Images successfully generated and saved to {output_dir}")
     except Exception as e:
         print(f"Error generating images: {e}")
@@ -91,13 +95,24 @@ def generate_from_pgn_folder(theme):
     folder_path = input("Enter the path to the folder containing PGN files: ").strip()
     output_dir = input("Enter the output directory: ").strip()
     final_position_only = input("Generate only the final position? (yes/no): ").strip().lower() == "yes"
+    overlay = input("Highlight the last move and checks? (yes/no): ").strip().lower() == "yes"
+    coordinates = input("Draw board coordinates? (yes/no): ").strip().lower() == "yes"
 
     if not os.path.isdir(folder_path):
         print(f"Folder not found: {folder_path}")
         return
 
+    deduplicate = input("Render each unique position only once? (yes/no): ").strip().lower() == "yes"
+    if deduplicate:
+        manifest_format = input("Manifest format (json/csv): ").strip().lower() or "json"
+        legacy_links = input("Link images under the legacy filenames? (yes/no): ").strip().lower() == "yes"
+
     try:
-        render_from_pgn_folder(folder_path, theme, output_dir, final_position_only)
+        if deduplicate:
+            render_unique_from_pgn_folder(folder_path, theme, output_dir, final_position_only, overlay, coordinates,
+                                          manifest_format, legacy_links)
+        else:
+            render_from_pgn_folder(folder_path, theme, output_dir, final_position_only, overlay, coordinates)
         print(f"Images successfully generated and saved to {output_dir}")
     except Exception as e:
         print(f"Error generating images: {e}")
@@ -1,10 +1,12 @@
-from PIL import Image
+from typing import Iterable, Optional
 
 from themes.theme import Theme
+from image_processing.layers import get_board_layers
 from utils.fen import fen_to_positions
 from utils.utils import read_file
 
-def render_from_fen(fen: str, theme: Theme, output_filename: str) -> None:
+def render_from_fen(fen: str, theme: Theme, output_filename: str, highlight_squares: Optional[Iterable[str]] = None,
+                    check_square: Optional[str] = None, coordinates: bool = False) -> None:
     """
     Render a chessboard image from a FEN string and save it to a file.
 
@@ -12,19 +14,14 @@ def render_from_fen(fen: str, theme: Theme, output_filename: str) -> None:
         fen (str): The FEN string representing the chessboard state.
         theme (Theme): The theme object containing the board and piece images.
         output_filename (str): The file path to save the generated image.
+        highlight_squares (Optional[Iterable[str]]): Squares to highlight, e.g. the last move.
+        check_square (Optional[str]): Square of the king in check, if any.
+        coordinates (bool): If True, draw rank and file labels on the board.
     """
-    board_image = Image.open(theme.board_image).convert("RGBA")
     piece_positions = fen_to_positions(fen)
+    layers = get_board_layers(theme, coordinates)
+    board_image = layers.compose(piece_positions, highlight_squares, check_square)
 
-    for square, piece in piece_positions.items():
-        if piece:
-            piece_image_path = theme.piece_images[piece]
-            piece_image = Image.open(piece_image_path).convert("RGBA")
-            x, y = theme.squares[square]["x"], theme.squares[square]["y"]
-            x -= piece_image.width // 2
-            y -= piece_image.height // 2
-            board_image.paste(piece_image, (x, y), piece_image)
-    
     board_image.save(f"{output_filename}.png")
 
 def render_from_fen_file(fen_file: str, theme: Theme, output_filename: str) -> None:
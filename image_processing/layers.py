@@ -0,0 +1,159 @@
+from typing import Dict, Iterable, Optional, Tuple
+
+from PIL import Image, ImageDraw, ImageFilter, ImageFont
+
+from themes.theme import Theme
+
+HIGHLIGHT_COLOR = (255, 214, 0, 110)
+CHECK_COLOR = (220, 30, 30)
+COORDINATE_COLOR = (40, 40, 40, 255)
+COORDINATE_OUTLINE = (255, 255, 255, 255)
+
+_layer_cache: Dict[Tuple, "BoardLayers"] = {}
+
+
+class BoardLayers:
+    """
+    Static image layers for a theme: the board (optionally with coordinates),
+    the piece images, a last-move highlight tile and a check marker tile.
+    """
+
+    def __init__(self, theme: Theme, coordinates: bool = False):
+        """
+        Build every static layer for a theme.
+
+        Args:
+            theme (Theme): The theme object containing the board and piece images.
+            coordinates (bool): If True, draw rank and file labels on the board.
+        """
+        self.theme = theme
+        self.board = Image.open(theme.board_image).convert("RGBA")
+        self.square_size = (theme.squares["h1"]["x"] - theme.squares["a1"]["x"]) // 7
+        self.pieces = {
+            piece: Image.open(path).convert("RGBA")
+            for piece, path in theme.piece_images.items()
+        }
+        self.highlight_tile = Image.new("RGBA", (self.square_size, self.square_size), HIGHLIGHT_COLOR)
+        self.check_tile = self._build_check_tile()
+
+        if coordinates:
+            self._draw_coordinates()
+
+    def _square_origin(self, square: str) -> Tuple[int, int]:
+        """
+        Return the top-left corner of a square on the board image.
+
+        Args:
+            square (str): The square name in algebraic notation.
+
+        Returns:
+            Tuple[int, int]: The x, y coordinates of the square's top-left corner.
+        """
+        x, y = self.theme.squares[square]["x"], self.theme.squares[square]["y"]
+        return x - self.square_size // 2, y - self.square_size // 2
+
+    def _build_check_tile(self) -> Image.Image:
+        """
+        Build a soft red radial marker drawn under a king in check.
+
+        Returns:
+            Image.Image: The RGBA check marker tile.
+        """
+        size = self.square_size
+        margin = size // 8
+        mask = Image.new("L", (size, size), 0)
+        ImageDraw.Draw(mask).ellipse((margin, margin, size - margin, size - margin), fill=200)
+        mask = mask.filter(ImageFilter.GaussianBlur(size // 10))
+
+        tile = Image.new("RGBA", (size, size), CHECK_COLOR + (0,))
+        tile.putalpha(mask)
+        return tile
+
+    def _draw_coordinates(self) -> None:
+        """
+        Draw file labels along the first rank and rank labels along the a-file.
+        """
+        draw = ImageDraw.Draw(self.board)
+        font = ImageFont.load_default(size=max(self.square_size // 6, 8))
+        padding = self.square_size // 20
+
+        for file_name in "abcdefgh":
+            x, y = self._square_origin(f"{file_name}1")
+            draw.text(
+                (x + self.square_size - padding, y + self.square_size - padding), file_name,
+                font=font, fill=COORDINATE_COLOR, anchor="rd",
+                stroke_width=1, stroke_fill=COORDINATE_OUTLINE,
+            )
+
+        for rank in range(1, 9):
+            x, y = self._square_origin(f"a{rank}")
+            draw.text(
+                (x + padding, y + padding), str(rank),
+                font=font, fill=COORDINATE_COLOR, anchor="lt",
+                stroke_width=1, stroke_fill=COORDINATE_OUTLINE,
+            )
+
+    def compose(self, piece_positions: Dict[str, str], highlight_squares: Optional[Iterable[str]] = None,
+                check_square: Optional[str] = None) -> Image.Image:
+        """
+        Compose a position on a copy of the static board.
+
+        Args:
+            piece_positions (Dict[str, str]): Mapping of square names to piece codes.
+            highlight_squares (Optional[Iterable[str]]): Squares to highlight, e.g. the last move.
+            check_square (Optional[str]): Square of the king in check, if any.
+
+        Returns:
+            Image.Image: The composed RGBA board image.
+        """
+        board_image = self.board.copy()
+
+        for square in highlight_squares or ():
+            board_image.alpha_composite(self.highlight_tile, self._square_origin(square))
+
+        if check_square:
+            board_image.alpha_composite(self.check_tile, self._square_origin(check_square))
+
+        for square, piece in piece_positions.items():
+            if piece:
+                piece_image = self.pieces[piece]
+                x, y = self.theme.squares[square]["x"], self.theme.squares[square]["y"]
+                x -= piece_image.width // 2
+                y -= piece_image.height // 2
+                board_image.paste(piece_image, (x, y), piece_image)
+
+        return board_image
+
+
+def get_board_layers(theme: Theme, coordinates: bool = False) -> BoardLayers:
+    """
+    Return the cached static layers for a theme, building them on first use.
+
+    Layers are keyed by the theme's image files and square positions, so themes
+    loaded twice from the same config share a single set of layers.
+
+    Args:
+        theme (Theme): The theme object containing the board and piece images.
+        coordinates (bool): If True, return the layers with rank and file labels.
+
+    Returns:
+        BoardLayers: The static layers for the theme.
+    """
+    key = (
+        theme.board_image,
+        tuple(sorted(theme.piece_images.items())),
+        tuple(sorted((square, pos["x"], pos["y"]) for square, pos in theme.squares.items())),
+        coordinates,
+    )
+    layers = _layer_cache.get(key)
+    if layers is None:
+        layers = BoardLayers(theme, coordinates)
+        _layer_cache[key] = layers
+    return layers
+
+
+def clear_layer_cache() -> None:
+    """
+    Drop every cached set of layers, e.g. after theme images change on disk.
+    """
+    _layer_cache.clear()
@@ -1,6 +1,11 @@
+import csv
+import hashlib
 import io
+import json
 import os
+from typing import Any, Dict, List, Optional, Tuple
 
+import chess
 from chess import pgn 
 
 from image_processing.fen_to_image import render_from_fen
@@ -10,7 +15,8 @@ from themes.theme import Theme
 
 
 
-def render_from_pgn_string(pgn_string: str, theme: Theme, output_dir: str, output_filename: str, final_position_only: bool = True) -> None:
+def render_from_pgn_string(pgn_string: str, theme: Theme, output_dir: str, output_filename: str, final_position_only: bool = True,
+                           overlay: bool = False, coordinates: bool = False) -> None:
     """
     Render chessboard images from a PGN string.
 
@@ -18,6 +24,8 @@ def render_from_pgn_string(pgn_string: str, theme: Theme, output_dir: str, outpu
         pgn_string (str): The PGN string containing the chess game.
         output_dir (str): The directory to save the generated images.
         final_position_only (bool): If True, generate an image only for the final position.
+        overlay (bool): If True, highlight the last move and mark a king in check.
+        coordinates (bool): If True, draw rank and file labels on the board.
     """
     game = pgn.read_game(io.StringIO(pgn_string))
     
@@ -26,22 +34,49 @@ def render_from_pgn_string(pgn_string: str, theme: Theme, output_dir: str, outpu
 
     board = game.board()
     move_number = 0
+    highlight_squares, check_square = None, None
 
     if final_position_only:
         for move in game.mainline_moves():
             board.push(move)
+        if overlay:
+            highlight_squares, check_square = move_overlay(board, board.peek() if board.move_stack else None)
         fen = board.fen()
         output_file = os.path.join(output_dir, output_filename)
-        render_from_fen(fen, theme, output_file)
+        render_from_fen(fen, theme, output_file, highlight_squares, check_square, coordinates)
     else:
         for move in game.mainline_moves():
             board.push(move)
+            if overlay:
+                highlight_squares, check_square = move_overlay(board, move)
             fen = board.fen()
             move_number += 1
             output_file = os.path.join(output_dir, f"{output_filename}_{move_number}")
-            render_from_fen(fen, theme, output_file)
+            render_from_fen(fen, theme, output_file, highlight_squares, check_square, coordinates)
 
-def render_from_pgn_file(pgn_file: str, theme: Theme, output_dir: str, output_filename: str, final_position_only: bool = True) -> None:
+def move_overlay(board: chess.Board, move: Optional[chess.Move]) -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
+    """
+    Return the overlay squares for a board right after a move was pushed.
+
+    Args:
+        board (chess.Board): The board with the move already pushed.
+        move (Optional[chess.Move]): The last move played, or None for the starting position.
+
+    Returns:
+        Tuple: The (from, to) squares of the move and the square of the king in check, if any.
+    """
+    highlight_squares = None
+    if move is not None:
+        highlight_squares = (chess.square_name(move.from_square), chess.square_name(move.to_square))
+
+    check_square = None
+    if board.is_check():
+        check_square = chess.square_name(board.king(board.turn))
+
+    return highlight_squares, check_square
+
+def render_from_pgn_file(pgn_file: str, theme: Theme, output_dir: str, output_filename: str, final_position_only: bool = True,
+                         overlay: bool = False, coordinates: bool = False) -> None:
     """
     Render chessboard images from a PGN file.
 
@@ -49,11 +84,14 @@ def render_from_pgn_file(pgn_file: str, theme: Theme, output_dir: str, output_fi
         pgn_file (str): Path to the PGN file.
         output_dir (str): The directory to save the generated images.
         final_position_only (bool): If True, generate an image only for the final position.
+        overlay (bool): If True, highlight the last move and mark a king in check.
+        coordinates (bool): If True, draw rank and file labels on the board.
     """
     pgn_string = read_file(pgn_file)
-    render_from_pgn_string(pgn_string, theme, output_dir, output_filename, final_position_only)
+    render_from_pgn_string(pgn_string, theme, output_dir, output_filename, final_position_only, overlay, coordinates)
 
-def render_from_pgn_folder(folder_path: str, theme: Theme, output_dir: str, final_position_only: bool = True) -> None:
+def render_from_pgn_folder(folder_path: str, theme: Theme, output_dir: str, final_position_only: bool = True,
+                           overlay: bool = False, coordinates: bool = False) -> None:
     """
     Render chessboard images from all PGN files in a folder.
 
@@ -61,9 +99,151 @@ def render_from_pgn_folder(folder_path: str, theme: Theme, output_dir: str, fina
         folder_path (str): Path to the folder containing PGN files.
         output_dir (str): The directory to save the generated images.
         final_position_only (bool): If True, generate an image only for the final position.
+        overlay (bool): If True, highlight the last move and mark a king in check.
+        coordinates (bool): If True, draw rank and file labels on the board.
     """
     for file_name in os.listdir(folder_path):
         if file_name.endswith(".pgn"):
             pgn_path = os.path.join(folder_path, file_name)
             output_filename = os.path.splitext(file_name)[0]
-            render_from_pgn_file(pgn_path, theme, output_dir, output_filename, final_position_only)
\ No newline at end of file
+            render_from_pgn_file(pgn_path, theme, output_dir, output_filename, final_position_only, overlay, coordinates)
+
+def render_unique_from_pgn_folder(folder_path: str, theme: Theme, output_dir: str, final_position_only: bool = True,
+                                  overlay: bool = False, coordinates: bool = False, manifest_format: str = "json",
+                                  legacy_links: bool = False) -> List[Dict[str, Any]]:
+    """
+    Render each unique position across all PGN files in a folder exactly once.
+
+    Every game of every file is replayed first, positions are keyed by the FEN
+    placement field (plus the overlay squares when enabled and the render
+    settings) and each key is rendered a single time. A manifest mapping every (file, game, ply) to its
+    image is written to the output directory.
+
+    Args:
+        folder_path (str): Path to the folder containing PGN files.
+        output_dir (str): The directory to save the generated images and manifest.
+        final_position_only (bool): If True, record only the final position of each game.
+        overlay (bool): If True, highlight the last move and mark a king in check.
+        coordinates (bool): If True, draw rank and file labels on the board.
+        manifest_format (str): Manifest format, either "json" or "csv".
+        legacy_links (bool): If True, hardlink images under the legacy filenames
+            ({name}.png or {name}_{ply}.png) for the first game of each file.
+
+    Returns:
+        List[Dict[str, Any]]: The manifest entries.
+
+    Raises:
+        ValueError: If the manifest format is unknown or a PGN file contains no game.
+    """
+    if manifest_format not in ("json", "csv"):
+        raise ValueError(f"Unknown manifest format: {manifest_format}")
+
+    positions = {}
+    entries = []
+    render_key = "|".join([theme.board_image, *sorted(theme.piece_images.values()), str(coordinates)])
+
+    for file_name in sorted(os.listdir(folder_path)):
+        if not file_name.endswith(".pgn"):
+            continue
+
+        pgn_handle = io.StringIO(read_file(os.path.join(folder_path, file_name)))
+        game = pgn.read_game(pgn_handle)
+        if game is None:
+            raise ValueError(f"The game object is invalid or could not be parsed from {file_name}.")
+
+        game_number = 0
+        while game is not None:
+            game_number += 1
+            board = game.board()
+            ply = 0
+            last_move = None
+
+            for move in game.mainline_moves():
+                board.push(move)
+                ply += 1
+                last_move = move
+                if not final_position_only:
+                    entries.append(record_position(positions, board, move, overlay, render_key, file_name, game_number, ply))
+
+            if final_position_only:
+                entries.append(record_position(positions, board, last_move, overlay, render_key, file_name, game_number, ply))
+
+            game = pgn.read_game(pgn_handle)
+
+    for image_name, (fen, highlight_squares, check_square) in positions.items():
+        output_file = os.path.join(output_dir, os.path.splitext(image_name)[0])
+        # Unlink first so a re-render never writes through hardlinks left by an earlier run
+        if os.path.exists(f"{output_file}.png"):
+            os.remove(f"{output_file}.png")
+        render_from_fen(fen, theme, output_file, highlight_squares, check_square, coordinates)
+
+    write_manifest(entries, output_dir, manifest_format)
+
+    if legacy_links:
+        for entry in entries:
+            if entry["game"] == 1:
+                name = os.path.splitext(entry["file"])[0]
+                legacy_name = name if final_position_only else f"{name}_{entry['ply']}"
+                legacy_path = os.path.join(output_dir, f"{legacy_name}.png")
+                if os.path.exists(legacy_path):
+                    os.remove(legacy_path)
+                os.link(os.path.join(output_dir, entry["image"]), legacy_path)
+
+    return entries
+
+def record_position(positions: Dict[str, Tuple], board: chess.Board, move: Optional[chess.Move], overlay: bool,
+                    render_key: str, file_name: str, game_number: int, ply: int) -> Dict[str, Any]:
+    """
+    Register a board position for rendering and return its manifest entry.
+
+    Args:
+        positions (Dict[str, Tuple]): Unique positions collected so far, keyed by image name.
+        board (chess.Board): The board with the move already pushed.
+        move (Optional[chess.Move]): The last move played, or None for the starting position.
+        overlay (bool): If True, the overlay squares are part of the position key.
+        render_key (str): The theme and render settings, so one image name always means one image.
+        file_name (str): The PGN file the position comes from.
+        game_number (int): The 1-based index of the game within the file.
+        ply (int): The number of half-moves played.
+
+    Returns:
+        Dict[str, Any]: The manifest entry for the position.
+    """
+    fen = board.fen()
+    placement = board.board_fen()
+    highlight_squares, check_square = move_overlay(board, move) if overlay else (None, None)
+
+    key = f"{placement}|{render_key}"
+    if overlay:
+        key = f"{key}|{','.join(highlight_squares or ())}|{check_square or ''}"
+    image_name = f"{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}.png"
+
+    if image_name not in positions:
+        positions[image_name] = (fen, highlight_squares, check_square)
+
+    return {"file": file_name, "game": game_number, "ply": ply, "placement": placement, "image": image_name}
+
+def write_manifest(entries: List[Dict[str, Any]], output_dir: str, manifest_format: str = "json") -> str:
+    """
+    Write the ply to image manifest to the output directory.
+
+    Args:
+        entries (List[Dict[str, Any]]): The manifest entries.
+        output_dir (str): The directory to save the manifest.
+        manifest_format (str): Manifest format, either "json" or "csv".
+
+    Returns:
+        str: The path of the written manifest.
+    """
+    manifest_path = os.path.join(output_dir, f"manifest.{manifest_format}")
+
+    if manifest_format == "csv":
+        with open(manifest_path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=["file", "game", "ply", "placement", "image"])
+            writer.writeheader()
+            writer.writerows(entries)
+    else:
+        with open(manifest_path, "w", encoding="utf-8") as file:
+            json.dump(entries, file, indent=2)
+
+    return manifest_path
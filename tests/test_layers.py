@@ -0,0 +1,70 @@
+import unittest
+
+from themes.theme import Theme
+from image_processing.layers import get_board_layers, clear_layer_cache
+from utils.fen import fen_to_positions
+
+
+class TestBoardLayers(unittest.TestCase):
+    """Unit tests for the cached static board layers."""
+
+    def setUp(self) -> None:
+        """Load the default theme and start from an empty cache."""
+        clear_layer_cache()
+        self.theme = Theme.from_file("themes/assets/standard/config.json")
+        self.positions = fen_to_positions("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1")
+
+    def tearDown(self) -> None:
+        """Drop the layers built by the test."""
+        clear_layer_cache()
+
+    # get_board_layers cached per theme
+    def test_layers_cached(self):
+        """Test that themes loaded from the same config share their layers."""
+        other_theme = Theme.from_file("themes/assets/standard/config.json")
+        self.assertIs(get_board_layers(self.theme), get_board_layers(other_theme))
+
+    # get_board_layers coordinates are a separate layer
+    def test_layers_coordinates(self):
+        """Test that the coordinates board is cached apart from the plain board."""
+        plain = get_board_layers(self.theme)
+        labelled = get_board_layers(self.theme, coordinates=True)
+        self.assertIsNot(plain, labelled)
+        self.assertNotEqual(plain.board.tobytes(), labelled.board.tobytes())
+
+    # compose does not alter the static board
+    def test_compose_leaves_board_untouched(self):
+        """Test that composing a position with overlays does not modify the cached board."""
+        layers = get_board_layers(self.theme)
+        board_bytes = layers.board.tobytes()
+
+        image = layers.compose(self.positions, ("e2", "e4"), "e1")
+
+        self.assertEqual(layers.board.tobytes(), board_bytes)
+        self.assertEqual(image.size, layers.board.size)
+
+    # compose highlights the given squares
+    def test_compose_highlight(self):
+        """Test that highlighted squares differ from the plain rendering."""
+        layers = get_board_layers(self.theme)
+        x, y = self.theme.squares["e4"]["x"], self.theme.squares["e4"]["y"]
+
+        plain = layers.compose(self.positions)
+        highlighted = layers.compose(self.positions, ("e2", "e4"))
+
+        self.assertNotEqual(plain.getpixel((x, y)), highlighted.getpixel((x, y)))
+
+
+    # compose keeps highlights inside their squares
+    def test_compose_highlight_bounds(self):
+        """Test that a highlight does not spill into the neighbouring squares."""
+        layers = get_board_layers(self.theme)
+        plain = layers.compose({})
+        highlighted = layers.compose({}, ("e4", "h5"))
+
+        # First pixels of f4 and last pixels of g5 on the standard board
+        for pixel in ((488, 440), (678, 343)):
+            self.assertEqual(plain.getpixel(pixel), highlighted.getpixel(pixel))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
+import csv
+import json
 import unittest
 import os
 import tempfile
 from unittest import mock
 
-from image_processing.pgn_to_image import render_from_pgn_string, render_from_pgn_file, render_from_pgn_folder
+from image_processing.pgn_to_image import render_from_pgn_string, render_from_pgn_file, render_from_pgn_folder, render_unique_from_pgn_folder
 from themes.theme import Theme
 
 class TestPGNToImage(unittest.TestCase):
@@ -28,6 +30,30 @@ class TestPGNToImage(unittest.TestCase):
         self.assertTrue(os.path.exists(path))
         os.remove(path)
 
+    # render_from_pgn_string overlay per move
+    @mock.patch("image_processing.pgn_to_image.render_from_fen")
+    def test_render_from_pgn_string_overlay(self, mock_render_from_fen):
+        """Test that per-move rendering passes the last move and the checked king."""
+        pgn_string = "1. e4 f5 2. Qh5+ *"
+        render_from_pgn_string(pgn_string, self.theme, self.output_dir.name, self.output_filename,
+                               final_position_only=False, overlay=True)
+
+        self.assertEqual(mock_render_from_fen.call_count, 3)
+        first_args = mock_render_from_fen.call_args_list[0][0]
+        last_args = mock_render_from_fen.call_args_list[-1][0]
+        self.assertEqual(first_args[3:5], (("e2", "e4"), None))
+        self.assertEqual(last_args[3:5], (("d1", "h5"), "e8"))
+
+    # render_from_pgn_string overlay and coordinates OK
+    def test_render_from_pgn_string_overlay_final(self):
+        """Test rendering the final position with overlays and coordinates."""
+        pgn_string = "1. e4 f5 2. Qh5+ *"
+        render_from_pgn_string(pgn_string, self.theme, self.output_dir.name, self.output_filename,
+                               final_position_only=True, overlay=True, coordinates=True)
+
+        path = os.path.join(self.output_dir.name, f"{self.output_filename}.png")
+        self.assertTrue(os.path.exists(path))
+
     # render_from_pgn_string INVALID STRING
     def test_render_from_pgn_string_error(self):
         """Test a standard rendering from an empty PGN string."""
@@ -90,5 +116,73 @@ class TestPGNToImage(unittest.TestCase):
         render_from_pgn_folder(folder_path, self.theme, self.output_dir.name, final_position_only=True)
         mock_listdir.assert_called_once_with(folder_path)
 
+    # render_unique_from_pgn_folder OK
+    def test_render_unique_from_pgn_folder(self):
+        """Test that shared positions across games are rendered only once."""
+        folder_path = tempfile.mkdtemp()
+        with open(os.path.join(folder_path, "game1.pgn"), "w", encoding="utf-8") as file:
+            file.write("1. e4 e5 2. Nf3 *\n\n1. e4 c5 *")
+        with open(os.path.join(folder_path, "game2.pgn"), "w", encoding="utf-8") as file:
+            file.write("1. e4 e5 2. Nf3 Nc6 *")
+
+        with mock.patch("image_processing.pgn_to_image.render_from_fen") as mock_render_from_fen:
+            entries = render_unique_from_pgn_folder(folder_path, self.theme, self.output_dir.name, final_position_only=False)
+
+        self.assertEqual(len(entries), 9)
+        self.assertEqual(mock_render_from_fen.call_count, 5)
+        self.assertEqual({entry["game"] for entry in entries if entry["file"] == "game1.pgn"}, {1, 2})
+
+        with open(os.path.join(self.output_dir.name, "manifest.json"), encoding="utf-8") as file:
+            self.assertEqual(json.load(file), entries)
+
+    # render_unique_from_pgn_folder CSV manifest and legacy links
+    def test_render_unique_from_pgn_folder_legacy_links(self):
+        """Test the CSV manifest and the hardlinks under the legacy filenames."""
+        folder_path = tempfile.mkdtemp()
+        with open(os.path.join(folder_path, "game1.pgn"), "w", encoding="utf-8") as file:
+            file.write("1. Nf3 Nf6 2. Ng1 Ng8 3. Nf3 *")
+
+        entries = render_unique_from_pgn_folder(folder_path, self.theme, self.output_dir.name, final_position_only=False,
+                                                manifest_format="csv", legacy_links=True)
+
+        self.assertEqual(entries[0]["image"], entries[4]["image"])
+        for ply in range(1, 6):
+            self.assertTrue(os.path.exists(os.path.join(self.output_dir.name, f"game1_{ply}.png")))
+        self.assertTrue(os.path.samefile(os.path.join(self.output_dir.name, "game1_1.png"),
+                                         os.path.join(self.output_dir.name, "game1_5.png")))
+
+        with open(os.path.join(self.output_dir.name, "manifest.csv"), encoding="utf-8", newline="") as file:
+            rows = list(csv.DictReader(file))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[4]["image"], entries[4]["image"])
+
+    # render_unique_from_pgn_folder reruns keep earlier legacy files
+    def test_render_unique_from_pgn_folder_rerun(self):
+        """Test that a second run with other settings does not alter earlier legacy files."""
+        folder_path = tempfile.mkdtemp()
+        with open(os.path.join(folder_path, "a.pgn"), "w", encoding="utf-8") as file:
+            file.write("1. e4 e5 *")
+        legacy_path = os.path.join(self.output_dir.name, "a.png")
+
+        first = render_unique_from_pgn_folder(folder_path, self.theme, self.output_dir.name, final_position_only=True,
+                                              coordinates=True, legacy_links=True)
+        with open(legacy_path, "rb") as file:
+            legacy_bytes = file.read()
+
+        second = render_unique_from_pgn_folder(folder_path, self.theme, self.output_dir.name, final_position_only=False,
+                                               coordinates=False, legacy_links=True)
+
+        self.assertNotEqual(first[0]["image"], second[-1]["image"])
+        with open(legacy_path, "rb") as file:
+            self.assertEqual(file.read(), legacy_bytes)
+        self.assertEqual(os.stat(legacy_path).st_nlink, 2)
+
+    # render_unique_from_pgn_folder invalid manifest format
+    def test_render_unique_from_pgn_folder_invalid_format(self):
+        """Test that an unknown manifest format raises an error."""
+        folder_path = tempfile.mkdtemp()
+        with self.assertRaises(ValueError):
+            render_unique_from_pgn_folder(folder_path, self.theme, self.output_dir.name, manifest_format="xml")
+
 if __name__ == "__main__":
     unittest.main()